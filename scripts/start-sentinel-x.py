@@ -1,297 +1,421 @@
-#!/usr/bin/env python3
-"""
-SENTINEL-X Startup Script
-Automated startup script for the SENTINEL-X Satellite Anomaly Detection Platform
-"""
-
-import os
-import sys
-import subprocess
-import time
-import threading
-import signal
-import json
-from pathlib import Path
-
-class SentinelXLauncher:
-    def __init__(self):
-        self.processes = []
-        self.project_root = Path(__file__).parent.parent
-        self.running = True
-        
-    def log(self, message, level="INFO"):
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] [{level}] {message}")
-        
-    def check_dependencies(self):
-        """Check if all required dependencies are installed"""
-        self.log("Checking dependencies...")
-        
-        # Check Python dependencies
-        try:
-            import flask
-            import tensorflow
-            import sklearn
-            import numpy
-            import requests
-            self.log("✓ Python dependencies verified")
-        except ImportError as e:
-            self.log(f"✗ Missing Python dependency: {e}", "ERROR")
-            self.log("Run: pip install -r requirements.txt", "ERROR")
-            return False
-            
-        # Check Node.js dependencies
-        if not (self.project_root / "node_modules").exists():
-            self.log("✗ Node.js dependencies not installed", "ERROR")
-            self.log("Run: npm install", "ERROR")
-            return False
-        else:
-            self.log("✓ Node.js dependencies verified")
-            
-        return True
-        
-    def start_ml_service(self):
-        """Start the Python ML service"""
-        self.log("Starting ML Service...")
-        
-        ml_service_path = self.project_root / "services" / "ml_service" / "main.py"
-        if not ml_service_path.exists():
-            self.log("✗ ML service not found", "ERROR")
-            return None
-            
-        try:
-            process = subprocess.Popen(
-                [sys.executable, str(ml_service_path)],
-                cwd=str(self.project_root),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Start thread to monitor ML service output
-            threading.Thread(
-                target=self.monitor_process_output,
-                args=(process, "ML-SERVICE"),
-                daemon=True
-            ).start()
-            
-            self.processes.append(("ML Service", process))
-            self.log("✓ ML Service started on port 5000")
-            return process
-            
-        except Exception as e:
-            self.log(f"✗ Failed to start ML service: {e}", "ERROR")
-            return None
-            
-    def start_frontend(self):
-        """Start the Next.js frontend"""
-        self.log("Starting Frontend...")
-        
-        try:
-            # Check if we should use dev or production mode
-            if os.getenv("NODE_ENV") == "production":
-                # Build and start production server
-                self.log("Building production frontend...")
-                build_process = subprocess.run(
-                    ["npm", "run", "build"],
-                    cwd=str(self.project_root),
-                    capture_output=True,
-                    text=True
-                )
-                
-                if build_process.returncode != 0:
-                    self.log(f"✗ Frontend build failed: {build_process.stderr}", "ERROR")
-                    return None
-                    
-                process = subprocess.Popen(
-                    ["npm", "start"],
-                    cwd=str(self.project_root),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                self.log("✓ Frontend started in production mode on port 3000")
-            else:
-                # Start development server
-                process = subprocess.Popen(
-                    ["npm", "run", "dev"],
-                    cwd=str(self.project_root),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                self.log("✓ Frontend started in development mode on port 3000")
-            
-            # Start thread to monitor frontend output
-            threading.Thread(
-                target=self.monitor_process_output,
-                args=(process, "FRONTEND"),
-                daemon=True
-            ).start()
-            
-            self.processes.append(("Frontend", process))
-            return process
-            
-        except Exception as e:
-            self.log(f"✗ Failed to start frontend: {e}", "ERROR")
-            return None
-            
-    def monitor_process_output(self, process, service_name):
-        """Monitor and log process output"""
-        try:
-            for line in iter(process.stdout.readline, ''):
-                if line and self.running:
-                    self.log(f"[{service_name}] {line.strip()}")
-        except Exception as e:
-            self.log(f"Error monitoring {service_name}: {e}", "ERROR")
-            
-    def wait_for_service(self, port, service_name, timeout=30):
-        """Wait for a service to be ready"""
-        import socket
-        
-        self.log(f"Waiting for {service_name} to be ready on port {port}...")
-        
-        for i in range(timeout):
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', port))
-                sock.close()
-                
-                if result == 0:
-                    self.log(f"✓ {service_name} is ready")
-                    return True
-                    
-            except Exception:
-                pass
-                
-            time.sleep(1)
-            
-        self.log(f"✗ {service_name} failed to start within {timeout} seconds", "ERROR")
-        return False
-        
-    def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            self.log("Received shutdown signal, stopping services...")
-            self.shutdown()
-            
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
-    def shutdown(self):
-        """Gracefully shutdown all services"""
-        self.running = False
-        self.log("Shutting down SENTINEL-X...")
-        
-        for service_name, process in self.processes:
-            try:
-                self.log(f"Stopping {service_name}...")
-                process.terminate()
-                
-                # Wait for graceful shutdown
-                try:
-                    process.wait(timeout=5)
-                    self.log(f"✓ {service_name} stopped")
-                except subprocess.TimeoutExpired:
-                    self.log(f"Force killing {service_name}...")
-                    process.kill()
-                    process.wait()
-                    
-            except Exception as e:
-                self.log(f"Error stopping {service_name}: {e}", "ERROR")
-                
-        self.log("SENTINEL-X shutdown complete")
-        sys.exit(0)
-        
-    def display_banner(self):
-        """Display startup banner"""
-        banner = """
-╔═══════════════════════════════════════════════════════════════╗
-║                                                               ║
-║   ███████╗███████╗███╗   ██╗████████╗██╗███╗   ██╗███████╗██╗ ║
-║   ██╔════╝██╔════╝████╗  ██║╚══██╔══╝██║████╗  ██║██╔════╝██║ ║
-║   ███████╗█████╗  ██╔██╗ ██║   ██║   ██║██╔██╗ ██║█████╗  ██║ ║
-║   ╚════██║██╔══╝  ██║╚██╗██║   ██║   ██║██║╚██╗██║██╔══╝  ██║ ║
-║   ███████║███████╗██║ ╚████║   ██║   ██║██║ ╚████║███████╗███████╗
-║   ╚══════╝╚══════╝╚═╝  ╚═══╝   ╚═╝   ╚═╝╚═╝  ╚═══╝╚══════╝╚══════╝
-║                                                               ║
-║              Advanced Satellite Anomaly Detection            ║
-║                     Platform - SENTINEL-X                    ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
-        
-    def display_status(self):
-        """Display system status and URLs"""
-        status_info = """
-╔═══════════════════════════════════════════════════════════════╗
-║                        SYSTEM STATUS                          ║
-╠═══════════════════════════════════════════════════════════════╣
-║                                                               ║
-║  🌐 Frontend Dashboard:  http://localhost:3000               ║
-║  🤖 ML Service API:      http://localhost:5000               ║
-║  📊 Real-time Updates:   WebSocket Connected                 ║
-║                                                               ║
-║  🛰️  Satellite Tracking: ACTIVE                              ║
-║  🧠 ML Anomaly Detection: ACTIVE                             ║
-║  📡 Space-Track Integration: CONFIGURED                      ║
-║                                                               ║
-╠═══════════════════════════════════════════════════════════════╣
-║                      QUICK ACTIONS                            ║
-║                                                               ║
-║  • Press Ctrl+C to shutdown gracefully                       ║
-║  • Check logs above for any issues                           ║
-║  • Visit the dashboard to start monitoring                   ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝
-        """
-        print(status_info)
-        
-    def run(self):
-        """Main execution method"""
-        self.display_banner()
-        self.setup_signal_handlers()
-        
-        # Check dependencies
-        if not self.check_dependencies():
-            sys.exit(1)
-            
-        # Start ML service first
-        ml_process = self.start_ml_service()
-        if not ml_process:
-            sys.exit(1)
-            
-        # Wait for ML service to be ready
-        if not self.wait_for_service(5000, "ML Service"):
-            self.shutdown()
-            sys.exit(1)
-            
-        # Start frontend
-        frontend_process = self.start_frontend()
-        if not frontend_process:
-            self.shutdown()
-            sys.exit(1)
-            
-        # Wait for frontend to be ready
-        if not self.wait_for_service(3000, "Frontend"):
-            self.shutdown()
-            sys.exit(1)
-            
-        # Display status
-        self.display_status()
-        
-        # Keep the main thread alive
-        try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.shutdown()
-
-if __name__ == "__main__":
-    launcher = SentinelXLauncher()
+#!/usr/bin/env python3
+"""
+SENTINEL-X Startup Script
+Automated startup script for the SENTINEL-X Satellite Anomaly Detection Platform
+"""
+
+import os
+import sys
+import subprocess
+import time
+import socket
+import select
+import selectors
+import signal
+import errno
+from collections import deque
+from pathlib import Path
+
+class SentinelXLauncher:
+    def __init__(self):
+        self.processes = []
+        # Resolve once (symlink-safe) and keep plain strings: these are only
+        # ever passed to os.path/subprocess, so no Path churn per call
+        self.project_root = str(Path(__file__).resolve().parent.parent)
+        self.ml_service_path = os.path.join(self.project_root, "services", "ml_service", "main.py")
+        self.node_modules = os.path.join(self.project_root, "node_modules")
+        self.running = True
+        self.selector = selectors.DefaultSelector()
+        self.pipe_tails = {}
+        self.capture_tails = {}
+        # Log fast path: write bytes straight to the stdout buffer and only
+        # re-run strftime when the wall-clock second changes
+        self._stdout_write = sys.stdout.buffer.write
+        self._last_sec = 0
+        self._last_ts = b''
+        self._unflushed = 0
+
+    def log(self, message, level="INFO"):
+        now = int(time.time())
+        if now != self._last_sec:
+            self._last_sec = now
+            self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S").encode('ascii')
+        self._stdout_write(
+            b"[%s] [%s] %s\n" % (self._last_ts, level.encode('ascii'),
+                                 message.encode('utf-8', 'replace'))
+        )
+        self._unflushed += 1
+        if self._unflushed >= 64:
+            self.flush_log()
+
+    def flush_log(self):
+        self._unflushed = 0
+        sys.stdout.buffer.flush()
+
+    def check_dependencies(self):
+        """Check if all required dependencies are installed"""
+        self.log("Checking dependencies...")
+        
+        # Check Python dependencies without importing them - find_spec only
+        # resolves each module's location, so TensorFlow's multi-second init
+        # never runs in the launcher process
+        import importlib.util
+        missing = [
+            mod for mod in ("flask", "tensorflow", "sklearn", "numpy", "requests")
+            if importlib.util.find_spec(mod) is None
+        ]
+        if missing:
+            self.log(f"✗ Missing Python dependencies: {', '.join(missing)}", "ERROR")
+            self.log("Run: pip install -r requirements.txt", "ERROR")
+            return False
+        self.log("✓ Python dependencies verified")
+            
+        # Check Node.js dependencies
+        if not os.path.exists(self.node_modules):
+            self.log("✗ Node.js dependencies not installed", "ERROR")
+            self.log("Run: npm install", "ERROR")
+            return False
+        else:
+            self.log("✓ Node.js dependencies verified")
+            
+        return True
+        
+    def start_ml_service(self):
+        """Start the Python ML service"""
+        self.log("Starting ML Service...")
+        
+        if not os.path.exists(self.ml_service_path):
+            self.log("✗ ML service not found", "ERROR")
+            return None
+
+        try:
+            process = subprocess.Popen(
+                [sys.executable, self.ml_service_path],
+                cwd=self.project_root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=65536,
+                start_new_session=True
+            )
+            
+            # Forward ML service output through the shared reactor
+            self.selector.register(process.stdout, selectors.EVENT_READ, "ML-SERVICE")
+
+            self.processes.append(("ML Service", process))
+            self.log("✓ ML Service started on port 5000")
+            return process
+            
+        except Exception as e:
+            self.log(f"✗ Failed to start ML service: {e}", "ERROR")
+            return None
+            
+    def start_frontend(self):
+        """Start the Next.js frontend"""
+        self.log("Starting Frontend...")
+        
+        try:
+            # Check if we should use dev or production mode
+            if os.getenv("NODE_ENV") == "production":
+                # Build and start production server. The build output streams
+                # through the reactor instead of being buffered whole in
+                # memory; only a short tail is kept for error reporting.
+                self.log("Building production frontend...")
+                build_process = subprocess.Popen(
+                    ["npm", "run", "build"],
+                    cwd=self.project_root,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=65536,
+                    start_new_session=True
+                )
+                self.capture_tails["BUILD"] = deque(maxlen=50)
+                self.selector.register(build_process.stdout, selectors.EVENT_READ, "BUILD")
+
+                while build_process.poll() is None:
+                    self.pump_output(timeout=0.5)
+                # Drain whatever is left in the pipe until EOF unregisters it
+                while any(key.data == "BUILD" for key in self.selector.get_map().values()):
+                    self.pump_output(timeout=0.5)
+
+                build_tail = self.capture_tails.pop("BUILD")
+                if build_process.returncode != 0:
+                    self.log(f"✗ Frontend build failed:\n" + "\n".join(build_tail), "ERROR")
+                    return None
+
+                process = subprocess.Popen(
+                    ["npm", "start"],
+                    cwd=self.project_root,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=65536,
+                    start_new_session=True
+                )
+                self.log("✓ Frontend started in production mode on port 3000")
+            else:
+                # Start development server
+                process = subprocess.Popen(
+                    ["npm", "run", "dev"],
+                    cwd=self.project_root,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=65536,
+                    start_new_session=True
+                )
+                self.log("✓ Frontend started in development mode on port 3000")
+            
+            # Forward frontend output through the shared reactor
+            self.selector.register(process.stdout, selectors.EVENT_READ, "FRONTEND")
+
+            self.processes.append(("Frontend", process))
+            return process
+            
+        except Exception as e:
+            self.log(f"✗ Failed to start frontend: {e}", "ERROR")
+            return None
+            
+    def pump_output(self, timeout=1.0):
+        """Drain ready child output pipes and forward their lines to the log.
+
+        Returns False once no pipes remain registered.
+        """
+        if not self.selector.get_map():
+            return False
+
+        for key, _ in self.selector.select(timeout):
+            service_name = key.data
+            try:
+                chunk = os.read(key.fd, 65536)
+            except OSError:
+                chunk = b''
+
+            tail = self.pipe_tails.setdefault(key.fd, bytearray())
+
+            if not chunk:
+                # EOF: flush any partial line and stop watching this pipe
+                if tail and self.running:
+                    self.log(f"[{service_name}] {tail.decode('utf-8', 'replace').strip()}")
+                self.pipe_tails.pop(key.fd, None)
+                self.selector.unregister(key.fileobj)
+                key.fileobj.close()
+                continue
+
+            tail += chunk
+            lines = tail.split(b'\n')
+            self.pipe_tails[key.fd] = lines.pop()  # keep any partial trailing line
+            capture = self.capture_tails.get(service_name)
+            for line in lines:
+                if line and self.running:
+                    text = line.decode('utf-8', 'replace').strip()
+                    self.log(f"[{service_name}] {text}")
+                    if capture is not None:
+                        capture.append(text)
+
+        if self._unflushed:
+            self.flush_log()
+        return True
+            
+    def wait_for_service(self, port, service_name, timeout=30):
+        """Wait for a single service to be ready"""
+        return self.wait_for_services([(port, service_name)], timeout)
+
+    def wait_for_services(self, services, timeout=30):
+        """Wait for every (port, service_name) pair to accept connections.
+
+        All ports are probed through one select loop, so total wait time is
+        bounded by the slowest service rather than the sum. Child output is
+        pumped between attempts to keep startup logs flowing (and the pipes
+        from filling) while we wait.
+        """
+        for port, service_name in services:
+            self.log(f"Waiting for {service_name} to be ready on port {port}...")
+
+        deadline = time.monotonic() + timeout
+        backoff = 0.01
+        pending = dict(services)  # port -> service name
+
+        while pending and time.monotonic() < deadline:
+            in_progress = {}
+            for port in list(pending):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                # 127.0.0.1 literal avoids a getaddrinfo lookup per attempt
+                err = sock.connect_ex(('127.0.0.1', port))
+                if err in (0, errno.EISCONN):
+                    sock.close()
+                    self.log(f"✓ {pending.pop(port)} is ready")
+                elif err in (errno.EINPROGRESS, errno.EALREADY):
+                    in_progress[sock] = port
+                else:
+                    sock.close()
+
+            if in_progress:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    _, writable, errored = select.select(
+                        [], list(in_progress), list(in_progress),
+                        min(backoff, remaining)
+                    )
+                    for sock in set(writable) | set(errored):
+                        err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                        if err == 0:
+                            self.log(f"✓ {pending.pop(in_progress[sock])} is ready")
+                for sock in in_progress:
+                    sock.close()
+
+            if pending:
+                wait = min(backoff, max(deadline - time.monotonic(), 0))
+                if not self.pump_output(timeout=wait):
+                    time.sleep(wait)
+                backoff = min(backoff * 2, 0.1)
+
+        for port, service_name in services:
+            if port in pending:
+                self.log(f"✗ {service_name} failed to start within {timeout} seconds", "ERROR")
+        return not pending
+        
+    def setup_signal_handlers(self):
+        """Setup signal handlers for graceful shutdown"""
+        def signal_handler(signum, frame):
+            self.log("Received shutdown signal, stopping services...")
+            self.shutdown()
+
+        def sigchld_handler(signum, frame):
+            if not self.running:
+                return
+            for service_name, process in self.processes:
+                if process.poll() is not None:
+                    self.log(f"✗ {service_name} exited unexpectedly "
+                             f"(code {process.returncode})", "ERROR")
+                    self.shutdown()
+
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        signal.signal(signal.SIGCHLD, sigchld_handler)
+        
+    def shutdown(self):
+        """Gracefully shutdown all services"""
+        self.running = False
+        self.log("Shutting down SENTINEL-X...")
+
+        # Each child runs in its own session, so its pid is also its process
+        # group id - killpg reaches grandchildren (webpack, next-server) that
+        # terminate() on the shell parent would miss. Signal every group
+        # first, then wait, so terminations overlap instead of serializing.
+        for service_name, process in self.processes:
+            try:
+                self.log(f"Stopping {service_name}...")
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            except Exception as e:
+                self.log(f"Error stopping {service_name}: {e}", "ERROR")
+
+        deadline = time.monotonic() + 5
+        for service_name, process in self.processes:
+            try:
+                # Wait for graceful shutdown
+                try:
+                    process.wait(timeout=max(deadline - time.monotonic(), 0))
+                    self.log(f"✓ {service_name} stopped")
+                except subprocess.TimeoutExpired:
+                    self.log(f"Force killing {service_name}...")
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    process.wait()
+
+            except Exception as e:
+                self.log(f"Error stopping {service_name}: {e}", "ERROR")
+                
+        self.log("SENTINEL-X shutdown complete")
+        self.flush_log()
+        sys.exit(0)
+        
+    def display_banner(self):
+        """Display startup banner"""
+        banner = """
+╔═══════════════════════════════════════════════════════════════╗
+║                                                               ║
+║   ███████╗███████╗███╗   ██╗████████╗██╗███╗   ██╗███████╗██╗ ║
+║   ██╔════╝██╔════╝████╗  ██║╚══██╔══╝██║████╗  ██║██╔════╝██║ ║
+║   ███████╗█████╗  ██╔██╗ ██║   ██║   ██║██╔██╗ ██║█████╗  ██║ ║
+║   ╚════██║██╔══╝  ██║╚██╗██║   ██║   ██║██║╚██╗██║██╔══╝  ██║ ║
+║   ███████║███████╗██║ ╚████║   ██║   ██║██║ ╚████║███████╗███████╗
+║   ╚══════╝╚══════╝╚═╝  ╚═══╝   ╚═╝   ╚═╝╚═╝  ╚═══╝╚══════╝╚══════╝
+║                                                               ║
+║              Advanced Satellite Anomaly Detection            ║
+║                     Platform - SENTINEL-X                    ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝
+        """
+        print(banner, flush=True)
+
+    def display_status(self):
+        """Display system status and URLs"""
+        status_info = """
+╔═══════════════════════════════════════════════════════════════╗
+║                        SYSTEM STATUS                          ║
+╠═══════════════════════════════════════════════════════════════╣
+║                                                               ║
+║  🌐 Frontend Dashboard:  http://localhost:3000               ║
+║  🤖 ML Service API:      http://localhost:5000               ║
+║  📊 Real-time Updates:   WebSocket Connected                 ║
+║                                                               ║
+║  🛰️  Satellite Tracking: ACTIVE                              ║
+║  🧠 ML Anomaly Detection: ACTIVE                             ║
+║  📡 Space-Track Integration: CONFIGURED                      ║
+║                                                               ║
+╠═══════════════════════════════════════════════════════════════╣
+║                      QUICK ACTIONS                            ║
+║                                                               ║
+║  • Press Ctrl+C to shutdown gracefully                       ║
+║  • Check logs above for any issues                           ║
+║  • Visit the dashboard to start monitoring                   ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝
+        """
+        self.flush_log()
+        print(status_info, flush=True)
+
+    def run(self):
+        """Main execution method"""
+        self.display_banner()
+        self.setup_signal_handlers()
+        
+        # Check dependencies
+        if not self.check_dependencies():
+            sys.exit(1)
+            
+        # Start both services up front - their startups are independent
+        ml_process = self.start_ml_service()
+        if not ml_process:
+            sys.exit(1)
+
+        frontend_process = self.start_frontend()
+        if not frontend_process:
+            self.shutdown()
+            sys.exit(1)
+
+        # Wait on both ports concurrently
+        if not self.wait_for_services([(5000, "ML Service"), (3000, "Frontend")]):
+            self.shutdown()
+            sys.exit(1)
+            
+        # Display status
+        self.display_status()
+        
+        # Pump child output from the main thread until shutdown. The selector
+        # blocks until a pipe is readable (a dying child wakes us via EOF and
+        # SIGCHLD); once no pipes remain we sleep in signal.pause() - zero
+        # wakeups while idle
+        try:
+            while self.running:
+                if not self.pump_output(timeout=None):
+                    signal.pause()
+        except KeyboardInterrupt:
+            self.shutdown()
+
+if __name__ == "__main__":
+    launcher = SentinelXLauncher()
     launcher.run()
\ No newline at end of file